@@ -28,13 +28,14 @@ from ._columns import (
     UInt128,
 )
 from ._database import DataBase, DuckFrame, Table
-from ._filehandlers import CSV, Json, NDJson, Parquet, ParquetPartitioned
+from ._filehandlers import CSV, Arrow, Json, NDJson, Parquet, ParquetPartitioned
 from ._folder import Folder
 from ._schema import Schema
 
 __all__ = [
     "CSV",
     "Array",
+    "Arrow",
     "Boolean",
     "Categorical",
     "Column",
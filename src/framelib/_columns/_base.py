@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import Literal, override
 
 import narwhals as nw
 import polars as pl
@@ -25,24 +25,24 @@ class Column(BaseEntry, ABC):
     """Whether this column has a unique constraint."""
     nullable: bool = field(default=True, kw_only=True)
     """Whether this column can contain null values."""
+    _nw_col: nw.Expr = field(init=False, repr=False)
+    _pl_col: pl.Expr = field(init=False, repr=False)
+
+    @override
+    def __set_name__(self, owner: type, name: str) -> None:
+        super(Column, self).__set_name__(owner, name)
+        self._nw_col = nw.col(name)
+        self._pl_col = pl.col(name)
 
     @property
     def nw_col(self) -> nw.Expr:
-        """Equivalent to `narwhals.col(self._name)`.
-
-        Returns:
-            nw.Expr: The `Narwhals` column expression corresponding to this column.
-        """
-        return nw.col(self._name)
+        """The `Narwhals` column expression, equivalent to `narwhals.col(self._name)`."""
+        return self._nw_col
 
     @property
     def pl_col(self) -> pl.Expr:
-        """Equivalent to `polars.col(self._name)`.
-
-        Returns:
-            pl.Expr: The `Polars` column expression corresponding to this column.
-        """
-        return pl.col(self._name)
+        """The `Polars` column expression, equivalent to `polars.col(self._name)`."""
+        return self._pl_col
 
     @property
     def sql_col(self) -> str:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import override
+from abc import ABC
+from typing import ClassVar
 
 import narwhals as nw
 import polars as pl
@@ -9,271 +9,116 @@ import polars as pl
 from ._base import Column
 
 
-@dataclass(slots=True, eq=False)
-class Boolean(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Boolean:
-        return nw.Boolean()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Boolean:
-        return pl.Boolean()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "BOOLEAN"
-
-
-@dataclass(slots=True, eq=False)
-class String(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.String:
-        return nw.String()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.String:
-        return pl.String()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "VARCHAR"
-
-
-@dataclass(slots=True, eq=False)
-class Date(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Date:
-        return nw.Date()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Date:
-        return pl.Date()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "DATE"
-
-
-@dataclass(slots=True, eq=False)
-class Float32(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Float32:
-        return nw.Float32()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Float32:
-        return pl.Float32()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "FLOAT"
-
-
-@dataclass(slots=True, eq=False)
-class Float64(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Float64:
-        return nw.Float64()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Float64:
-        return pl.Float64()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "DOUBLE"
-
-
-@dataclass(slots=True, eq=False)
-class Int8(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Int8:
-        return nw.Int8()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Int8:
-        return pl.Int8()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "TINYINT"
-
-
-@dataclass(slots=True, eq=False)
-class Int16(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Int16:
-        return nw.Int16()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Int16:
-        return pl.Int16()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "SMALLINT"
-
-
-@dataclass(slots=True, eq=False)
-class Int32(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Int32:
-        return nw.Int32()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Int32:
-        return pl.Int32()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "INTEGER"
-
-
-@dataclass(slots=True, eq=False)
-class Int64(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Int64:
-        return nw.Int64()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Int64:
-        return pl.Int64()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "BIGINT"
-
-
-@dataclass(slots=True, eq=False)
-class Int128(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.Int128:
-        return nw.Int128()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.Int128:
-        return pl.Int128()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "HUGEINT"
-
-
-@dataclass(slots=True, eq=False)
-class UInt8(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.UInt8:
-        return nw.UInt8()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.UInt8:
-        return pl.UInt8()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "UTINYINT"
-
-
-@dataclass(slots=True, eq=False)
-class UInt16(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.UInt16:
-        return nw.UInt16()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.UInt16:
-        return pl.UInt16()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "USMALLINT"
-
-
-@dataclass(slots=True, eq=False)
-class UInt32(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.UInt32:
-        return nw.UInt32()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.UInt32:
-        return pl.UInt32()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "UINTEGER"
-
-
-@dataclass(slots=True, eq=False)
-class UInt64(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.UInt64:
-        return nw.UInt64()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.UInt64:
-        return pl.UInt64()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "UBIGINT"
-
-
-@dataclass(slots=True, eq=False)
-class UInt128(Column):
-    @property
-    @override
-    def nw_dtype(self) -> nw.UInt128:
-        return nw.UInt128()
-
-    @property
-    @override
-    def pl_dtype(self) -> pl.UInt128:
-        return pl.UInt128()
-
-    @property
-    @override
-    def sql_type(self) -> str:
-        return "UHUGEINT"
+class _Scalar(Column, ABC):
+    """A column whose dtypes do not depend on any parameter, and are thus shared by all its instances.
+
+    Each subclass declares its own `nw_dtype` and `pl_dtype`, so that their precise types are kept.
+    """
+
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    sql_type: ClassVar[str]  # pyright: ignore[reportIncompatibleMethodOverride]
+
+
+class Boolean(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Boolean] = nw.Boolean()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Boolean] = pl.Boolean()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "BOOLEAN"
+
+
+class String(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.String] = nw.String()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.String] = pl.String()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "VARCHAR"
+
+
+class Date(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Date] = nw.Date()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Date] = pl.Date()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "DATE"
+
+
+class Float32(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Float32] = nw.Float32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Float32] = pl.Float32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "FLOAT"
+
+
+class Float64(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Float64] = nw.Float64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Float64] = pl.Float64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "DOUBLE"
+
+
+class Int8(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Int8] = nw.Int8()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Int8] = pl.Int8()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "TINYINT"
+
+
+class Int16(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Int16] = nw.Int16()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Int16] = pl.Int16()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "SMALLINT"
+
+
+class Int32(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Int32] = nw.Int32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Int32] = pl.Int32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "INTEGER"
+
+
+class Int64(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Int64] = nw.Int64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Int64] = pl.Int64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "BIGINT"
+
+
+class Int128(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.Int128] = nw.Int128()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.Int128] = pl.Int128()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "HUGEINT"
+
+
+class UInt8(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.UInt8] = nw.UInt8()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.UInt8] = pl.UInt8()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "UTINYINT"
+
+
+class UInt16(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.UInt16] = nw.UInt16()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.UInt16] = pl.UInt16()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "USMALLINT"
+
+
+class UInt32(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.UInt32] = nw.UInt32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.UInt32] = pl.UInt32()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "UINTEGER"
+
+
+class UInt64(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.UInt64] = nw.UInt64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.UInt64] = pl.UInt64()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "UBIGINT"
+
+
+class UInt128(_Scalar):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    nw_dtype: ClassVar[nw.UInt128] = nw.UInt128()  # pyright: ignore[reportIncompatibleMethodOverride]
+    pl_dtype: ClassVar[pl.UInt128] = pl.UInt128()  # pyright: ignore[reportIncompatibleMethodOverride]
+    sql_type: ClassVar[str] = "UHUGEINT"
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from inspect import isclass
+from dataclasses import dataclass, field
+from functools import cache
+from inspect import isclass, signature
 from typing import TYPE_CHECKING, override
 
 import narwhals as nw
 import polars as pl
-from pyochain import Dict, Iter, Seq, Set
+from pyochain import Dict, Set
 
 from ._base import Column, TimeUnit
 
@@ -17,6 +18,9 @@ if TYPE_CHECKING:
 
     from .._core import Layout
 
+_NW_DECIMAL_PARAMS = "precision" in signature(nw.Decimal).parameters
+"""Whether `nw.Decimal` accepts a precision and a scale, which narwhals supports from 2.16.0."""
+
 
 @dataclass(slots=True, eq=False)
 class Datetime(Column):
@@ -49,6 +53,8 @@ class Decimal(Column):
     @property
     @override
     def nw_dtype(self) -> nw.Decimal:
+        if _NW_DECIMAL_PARAMS:
+            return nw.Decimal(self.precision, self.scale)
         return nw.Decimal()
 
     @property
@@ -66,16 +72,22 @@ class Decimal(Column):
 class Array(Column):
     inner: Column
     shape: int | tuple[int, ...]
+    _nw_dtype: nw.Array = field(init=False, repr=False)
+    _pl_dtype: pl.Array = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._nw_dtype = nw.Array(self.inner.nw_dtype, self.shape)
+        self._pl_dtype = pl.Array(self.inner.pl_dtype, self.shape)
 
     @property
     @override
     def nw_dtype(self) -> nw.Array:
-        return nw.Array(self.inner.nw_dtype, self.shape)
+        return self._nw_dtype
 
     @property
     @override
     def pl_dtype(self) -> pl.Array:
-        return pl.Array(self.inner.pl_dtype, self.shape)
+        return self._pl_dtype
 
     @property
     @override
@@ -83,13 +95,15 @@ class Array(Column):
         base: str = self.inner.sql_type
         if isinstance(self.shape, int):
             return f"{base}[{self.shape}]"
-        dims = Iter(self.shape).map(lambda d: f"[{d}]").join("")
+        dims = "".join(f"[{d}]" for d in self.shape)
         return f"{base}{dims}"
 
 
 @dataclass(slots=True, init=False, eq=False)
 class Struct(Column):
     fields: Dict[str, Column]
+    _nw_dtype: nw.Struct = field(init=False, repr=False)
+    _pl_dtype: pl.Struct = field(init=False, repr=False)
 
     def __init__(
         self,
@@ -103,6 +117,12 @@ class Struct(Column):
             self.fields = fields.entries()
         else:
             self.fields = Dict(fields)
+        self._pl_dtype = pl.Struct({
+            name: col.pl_dtype for name, col in self.fields.items()
+        })
+        self._nw_dtype = nw.Struct({
+            name: col.nw_dtype for name, col in self.fields.items()
+        })
         super(Struct, self).__init__(
             primary_key=primary_key, unique=unique, nullable=nullable
         )
@@ -110,52 +130,39 @@ class Struct(Column):
     @property
     @override
     def pl_dtype(self) -> pl.Struct:
-        return (
-            self.fields
-            .items()
-            .iter()
-            .map_star(lambda name, col: pl.Field(name, col.pl_dtype))
-            .collect(Seq)
-            .into(pl.Struct)
-        )
+        return self._pl_dtype
 
     @property
     @override
     def nw_dtype(self) -> nw.Struct:
-        return (
-            self.fields
-            .items()
-            .iter()
-            .map_star(lambda name, col: nw.Field(name, col.nw_dtype))
-            .collect(Seq)
-            .into(nw.Struct)
-        )
+        return self._nw_dtype
 
     @property
     @override
     def sql_type(self) -> str:
-        return (
-            self.fields
-            .items()
-            .iter()
-            .map_star(lambda name, col: f"{name} {col.sql_type}")
-            .into(lambda inner: f"STRUCT({inner.join(', ')})")
-        )
+        inner = ", ".join(f"{name} {col.sql_type}" for name, col in self.fields.items())
+        return f"STRUCT({inner})"
 
 
 @dataclass(slots=True, eq=False)
 class List(Column):
     inner: Column
+    _nw_dtype: nw.List = field(init=False, repr=False)
+    _pl_dtype: pl.List = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._nw_dtype = nw.List(self.inner.nw_dtype)
+        self._pl_dtype = pl.List(self.inner.pl_dtype)
 
     @property
     @override
     def nw_dtype(self) -> nw.List:
-        return nw.List(self.inner.nw_dtype)
+        return self._nw_dtype
 
     @property
     @override
     def pl_dtype(self) -> pl.List:
-        return pl.List(self.inner.pl_dtype)
+        return self._pl_dtype
 
     @property
     @override
@@ -163,8 +170,9 @@ class List(Column):
         return f"{self.inner.sql_type}[]"
 
 
-@dataclass(slots=True, eq=False)
 class Categorical(Column):
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+
     @property
     @override
     def nw_dtype(self) -> nw.Categorical:
@@ -190,6 +198,8 @@ class Categorical(Column):
 @dataclass(slots=True, init=False, eq=False)
 class Enum(Column):
     categories: Set[str]
+    _nw_dtype: nw.Enum = field(init=False, repr=False)
+    _pl_dtype: pl.Enum = field(init=False, repr=False)
 
     def __init__(
         self,
@@ -201,7 +211,9 @@ class Enum(Column):
     ) -> None:
         if isclass(categories):
             categories = (item.value for item in categories)  # pyright: ignore[reportAny]
-        self.categories = Set(categories)
+        values = tuple(dict.fromkeys(categories))
+        self.categories = Set(values)
+        self._nw_dtype, self._pl_dtype = _enum_dtypes(values)
         super(Enum, self).__init__(
             primary_key=primary_key, unique=unique, nullable=nullable
         )
@@ -209,12 +221,12 @@ class Enum(Column):
     @property
     @override
     def nw_dtype(self) -> nw.Enum:
-        return nw.Enum(self.categories)
+        return self._nw_dtype
 
     @property
     @override
     def pl_dtype(self) -> pl.Enum:
-        return pl.Enum(self.categories)
+        return self._pl_dtype
 
     @property
     @override
@@ -226,3 +238,16 @@ class Enum(Column):
         Since `Column` role is not responsible for handling table/database level logic, we return `VARCHAR` here.
         """
         return "VARCHAR"
+
+
+@cache
+def _enum_dtypes(categories: tuple[str, ...]) -> tuple[nw.Enum, pl.Enum]:
+    """Builds the dtypes of an `Enum`, shared by the enums with the same categories.
+
+    Args:
+        categories (tuple[str, ...]): The unique categories of the enum, in input order.
+
+    Returns:
+        tuple[nw.Enum, pl.Enum]: The `Narwhals` and `Polars` dtypes.
+    """
+    return nw.Enum(categories), pl.Enum(categories)
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import TYPE_CHECKING, TypeIs, override
+from typing import TYPE_CHECKING, ClassVar, TypeIs, override
 
-from pyochain import Dict, Vec
+from pyochain import Dict
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -38,20 +38,19 @@ class Layout[T: BaseEntry](ABC):
     """
 
     _entries: Dict[str, T]
+    _entry_type: ClassVar[type[BaseEntry]] = BaseEntry
+    """The type of the entries collected by the layout."""
 
     def __init_subclass__(cls) -> None:
-        def _is_base_entry(obj: object) -> TypeIs[T]:
-            return isinstance(obj, BaseEntry)
-
-        cls._entries = (
-            Vec
-            .from_ref(cls.mro())
-            .rev()
-            .filter(lambda c: c is not object and hasattr(c, "__dict__"))
-            .flat_map(lambda c: c.__dict__.items())
-            .filter_star(lambda _, obj: _is_base_entry(obj))  # pyright: ignore[reportAny]
-            .collect(Dict)
-        )
+        def _is_entry(obj: object) -> TypeIs[T]:
+            return isinstance(obj, cls._entry_type)
+
+        cls._entries = Dict({
+            name: obj
+            for c in reversed(cls.__mro__)
+            for name, obj in vars(c).items()  # pyright: ignore[reportAny]
+            if _is_entry(obj)  # pyright: ignore[reportAny]
+        })
 
     @classmethod
     def entries(cls) -> Dict[str, T]:
@@ -3,10 +3,10 @@ from __future__ import annotations
 from enum import StrEnum
 from typing import TYPE_CHECKING, NamedTuple, Self
 
-from pyochain import Option, Set
+from pyochain import Option, Seq
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Iterable
 
     from .._columns import Column
 
@@ -22,16 +22,12 @@ class KWord(StrEnum):
 class Constraint(NamedTuple):
     """Represents a constraint on a set of columns."""
 
-    cols: Set[Column]
+    cols: Seq[Column]
     k_word: KWord
 
     @classmethod
-    def new(
-        cls, cols: Set[Column], predicate: Callable[[Column], bool], k_word: KWord
-    ) -> Option[Self]:
-        return (
-            cols.iter().filter(predicate).collect(Set).then(lambda cs: cls(cs, k_word))
-        )
+    def new(cls, cols: Iterable[Column], k_word: KWord) -> Option[Self]:
+        return Seq(cols).then(lambda cs: cls(cs, k_word))
 
     def is_composite(self) -> bool:
         return self.cols.len() > 1
@@ -56,17 +52,30 @@ class KeysConstraints(NamedTuple):
     """The NOT NULL columns, if any."""
 
     @classmethod
-    def from_cols(cls, cols: Set[Column]) -> Self:
+    def from_cols(cls, cols: Iterable[Column]) -> Self:
         """Build constraints from a set of columns.
 
+        The flags of each column are read in a single pass,
+        and each constraint keeps its columns in definition order, so composite keys are emitted deterministically.
+
         Args:
-            cols (Set[Column]): The columns to extract constraints from.
+            cols (Iterable[Column]): The columns to extract constraints from.
 
         Returns:
             Self: The constructed KeysConstraints.
         """
+        primary: list[Column] = []
+        uniques: list[Column] = []
+        not_nulls: list[Column] = []
+        for col in cols:
+            if col.primary_key:
+                primary.append(col)
+            if col.unique:
+                uniques.append(col)
+            if not col.nullable:
+                not_nulls.append(col)
         return cls(
-            Constraint.new(cols, lambda c: c.primary_key, KWord.PRIMARY_KEY),
-            Constraint.new(cols, lambda c: c.unique, KWord.UNIQUE),
-            Constraint.new(cols, lambda c: not c.nullable, KWord.NOT_NULL),
+            Constraint.new(primary, KWord.PRIMARY_KEY),
+            Constraint.new(uniques, KWord.UNIQUE),
+            Constraint.new(not_nulls, KWord.NOT_NULL),
         )
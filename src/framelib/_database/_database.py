@@ -1,42 +1,71 @@
 from __future__ import annotations
 
 import contextlib
+import copy
 from abc import ABC
 from functools import wraps
 from pathlib import Path
-from typing import TYPE_CHECKING, Self, override
+from typing import TYPE_CHECKING, ClassVar, Self, override
 
-import duckdb
 import narwhals as nw
-from pyochain import Set
+from pyochain import Dict, Set
 from pyochain.abc import Pipeable
 
 from .._core import BaseEntry, Layout
 from . import qry
+from ._pool import ConnexionPool
 from ._table import DuckFrame, Table
 
 if TYPE_CHECKING:
     from collections.abc import Callable
     from types import TracebackType
 
+    import duckdb
+
 _DDB = ".ddb"
 
 
+class _Entries:
+    """Resolves `DataBase.entries` to the tables of the instance it is accessed through, or to those of the class."""
+
+    def __get__(
+        self, instance: DataBase | None, owner: type[DataBase]
+    ) -> Callable[[], Dict[str, Table]]:
+        layout = owner if instance is None else instance
+        return lambda: layout._entries  # pyright: ignore[reportPrivateUsage]
+
+
 class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipeable):
     """A DataBase represents a DuckDB database.
 
     It's a `Schema` of `Table` entries.
 
-    It's itself a `BaseEntry` that can be used as an entry in a `Folder` (thanks to _is_file attribute).
+    It's itself a `BaseEntry` that can be used as an entry in a `Folder`, since layouts collect their entries by `isinstance` checks.
 
     The connexion to the database is managed via context manager methods (`__enter__` and `__exit__`), or via the `connect` decorator.
 
     The latter is the recommended, idiomatic way of dealing with database connections in FrameliB.
+
+    By default, the database file is opened on entering the outermost `with` block and released on exiting it.
+
+    Set `keep_alive` to `True` on a subclass to keep the underlying DuckDB database open across `with` blocks,
+    so that its buffer cache and catalog survive between them.
+    The file then stays locked for other processes until `shutdown` is called.
     """
 
+    keep_alive: ClassVar[bool] = False
+    """Whether the DuckDB database is kept open across `with` blocks until `shutdown` is called."""
+    _instances: ClassVar[Dict[Path, duckdb.DuckDBPyConnection]] = Dict({})
+    """Long-lived DuckDB connections of the `keep_alive` databases, one per file, from which each context's cursor is created."""
     _is_connected: bool = False
     _entry_count: int = 0
     _connexion: duckdb.DuckDBPyConnection
+    _pool: ConnexionPool
+    entries: _Entries = _Entries()  # pyright: ignore[reportIncompatibleMethodOverride]
+    """Gets the entries dictionary of the database.
+
+    Accessed through an instance, the tables are its own copies, bound to its connexion pool.
+    """
 
     @override
     def __call__[**P, R](self, fn: Callable[P, R]) -> Callable[P, R]:
@@ -76,34 +105,48 @@ class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipea
         return wrapper
 
     def __set_source__(self, source: Path) -> None:  # noqa: PLW3201
-        self.__source__: Path = Path(source, self._name).with_suffix(_DDB)
-        return (
-            self
-            .entries()
-            .values()
-            .iter()
-            .for_each(
-                lambda table: table.__set_source__(self.__source__),
-            )
-        )
+        self.__source__: Path = Path(source, f"{self._name}{_DDB}")
+        self._pool = ConnexionPool()
+        db_source = self.__source__
+        # The class attributes are shared with the other instances and the subclasses,
+        # so this instance gets its own copies, bound to its own pool.
+        self._entries: Dict[str, Table] = Dict({})
+        for name, table in type(self).entries().items():
+            table.__set_source__(db_source)
+            own = copy.copy(table)
+            own.__set_connexion__(self._pool)
+            setattr(self, name, own)
+            _ = self._entries.insert(name, own)
 
     def __enter__(self) -> Self:
         """Enters the context manager, opening the connection to the database.
 
         Supports reentrant usage: nested `with db:` blocks share the same connection.
 
+        If `keep_alive` is set, the connection is a cursor on the database instance cached for this file, which is opened on first use only.
+
+        `duckdb` is imported here rather than at module level, so importing framelib does not pay its startup cost.
+
         Returns:
             Self: The database instance.
         """
         if self._entry_count == 0:
-            self._connexion = duckdb.connect(self.source)
-            (
-                self
-                .entries()
-                .values()
-                .iter()
-                .for_each(lambda table: table.__set_connexion__(self._connexion))
-            )
+            import duckdb
+
+            if self.keep_alive:
+                self._connexion = (
+                    self._instances
+                    .get_item(self.source)
+                    .unwrap_or_else(
+                        lambda: self._instances.setdefault(
+                            self.source, duckdb.connect(self.source)
+                        )
+                    )
+                    .cursor()
+                )
+            else:
+                self._connexion = duckdb.connect(self.source)
+            self._pool.open(self._connexion)
             self._is_connected = True
         self._entry_count += 1
 
@@ -118,6 +161,7 @@ class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipea
         """Exits the context manager, closing the connection only when exiting the outermost block."""
         self._entry_count -= 1
         if self._entry_count == 0:
+            self._pool.close()
             self._connexion.close()
             self._is_connected = False
 
@@ -125,6 +169,19 @@ class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipea
         with contextlib.suppress(Exception):
             self._connexion.close()
 
+    def shutdown(self) -> Self:
+        """Closes the DuckDB database instance kept alive for this file, releasing the file.
+
+        This also closes any connection still open on it, so call it outside of `with` blocks.
+
+        The next connection will reopen the database. Does nothing if the database is not kept alive.
+
+        Returns:
+            Self: The database instance.
+        """
+        _ = self._instances.remove(self.source).map(lambda con: con.close())
+        return self
+
     def connect(self) -> Self:
         """Manually connects to the database.
 
@@ -173,7 +230,7 @@ class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipea
         Returns:
             DuckFrame: The result of the *query* as a Narwhals `LazyFrame`.
         """
-        return nw.from_native(self._connexion.sql(sql_query))
+        return nw.from_native(self._pool.get().sql(sql_query))
 
     def show_tables(self) -> DuckFrame:
         """Shows all tables in the database.
@@ -202,18 +259,33 @@ class DataBase(Layout[Table], BaseEntry, ABC, contextlib.ContextDecorator, Pipea
     def sync_schema(self) -> Self:
         """Drops tables from the database that are not present in the schema.
 
+        The drops run in a single transaction, so the catalog is committed once, and no transaction is opened if nothing is stale.
+
         Returns:
             Self: The database instance.
-        """
-        (
-            self
-            .show_tables()
-            .collect()
-            .pipe(lambda df: Set(df.get_column("name")))
-            .difference(self.entries().keys())
-            .iter()
-            .for_each(lambda q: self.connexion.execute(qry.drop_if_exists(q)))  # pyright: ignore[reportAny]
-        )
+
+        Raises:
+            BaseException: Anything interrupting the drops, even a `KeyboardInterrupt`, once the transaction is rolled back.
+        """  # noqa: DOC502
+        with self._pool.lock:
+            con = self._pool.get()
+            stale = (
+                self
+                .show_tables()
+                .collect()
+                .pipe(lambda df: Set(df.get_column("name")))
+                .difference(self.entries().keys())
+            )
+            if stale.is_empty():
+                return self
+            _ = con.begin()
+            try:
+                stale.iter().for_each(lambda q: con.execute(qry.drop_if_exists(q)))  # pyright: ignore[reportAny]
+            except BaseException:
+                _ = con.rollback()
+                raise
+            else:
+                _ = con.commit()
 
         return self
 
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from pyochain import Vec
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+
+class ConnexionPool:
+    """Hands out one DuckDB connection per thread, all sharing the same database.
+
+    A `DuckDBPyConnection` is not safe to use from several threads at once.
+
+    The thread that opened the database keeps using the main connection,
+    while every other thread lazily gets its own `cursor()` on it, so reads can run in parallel.
+
+    Writes go through `lock`, since DuckDB only allows a single writer without conflicts.
+
+    A `DataBase` creates its pool once and hands it to its tables at definition time,
+    then `open`s and `close`s it around each connection, so entering a context does not rebind every table.
+
+    Attributes:
+        lock (threading.RLock): Serializes the writes across all the connections of the pool.
+    """
+
+    __slots__ = ("_cursors", "_local", "_main", "_owner", "lock")  # pyright: ignore[reportUnannotatedClassAttribute]
+    _main: DuckDBPyConnection  # pyright: ignore[reportUninitializedInstanceVariable]
+    _owner: int  # pyright: ignore[reportUninitializedInstanceVariable]
+    _local: threading.local
+    _cursors: Vec[DuckDBPyConnection]
+    lock: threading.RLock
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._cursors = Vec(())
+        self.lock = threading.RLock()
+
+    def open(self, main: DuckDBPyConnection) -> None:
+        """Starts handing out connections on the database of `main`.
+
+        Args:
+            main (DuckDBPyConnection): The connection opened by the `DataBase`, used by the current thread.
+        """
+        self._main = main
+        self._owner = threading.get_ident()
+
+    def get(self) -> DuckDBPyConnection:
+        """Get the connection of the current thread, creating it on first use.
+
+        Returns:
+            DuckDBPyConnection: The main connection for the owner thread, a dedicated cursor otherwise.
+
+        Raises:
+            RuntimeError: If the pool is not open.
+        """
+        try:
+            main = self._main
+        except AttributeError:
+            msg = "The table is not connected to any database."
+            raise RuntimeError(msg) from None
+        if threading.get_ident() == self._owner:
+            return main
+        try:
+            return self._local.cursor  # pyright: ignore[reportAny]
+        except AttributeError:
+            with self.lock:
+                cursor = main.cursor()
+                self._cursors.append(cursor)
+            self._local.cursor = cursor
+            return cursor
+
+    def close(self) -> None:
+        """Closes the cursors created for the other threads, and stops handing out connections until the next `open`.
+
+        The main connection is left to the `DataBase` that owns it.
+        """
+        with self.lock:
+            self._cursors.drain().for_each(lambda cursor: cursor.close())
+            self._local = threading.local()
+            del self._main
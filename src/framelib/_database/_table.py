@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Self
 
 import narwhals as nw
-from duckdb import DuckDBPyConnection, DuckDBPyRelation
 from pyochain import Err, Ok, Result
 
 from .._core import Entry
@@ -11,32 +11,57 @@ from . import qry
 
 if TYPE_CHECKING:
     import polars as pl
-    from narwhals.typing import IntoFrame, IntoFrameT, IntoLazyFrame, IntoLazyFrameT
+    from duckdb import DuckDBPyConnection, DuckDBPyRelation, Statement
+    from narwhals.typing import IntoFrame, IntoLazyFrame
 
     from .._schema import Schema
+    from ._pool import ConnexionPool
 
 type DuckFrame = nw.LazyFrame[DuckDBPyRelation]
 """Syntactic sugar for `narwhals.LazyFrame[DuckDBPyRelation]`"""
+_CACHE_SIZE = 256
+"""Maximum number of parsed statements kept."""
 
 
-def _from_df(
-    schema: type[Schema], df: IntoFrameT | IntoLazyFrameT
-) -> IntoFrameT | IntoLazyFrameT:
+@lru_cache(maxsize=_CACHE_SIZE)
+def _parse(con: DuckDBPyConnection, q: str) -> Statement | str:
+    """Parse a `SQL` *query* once per connection, so that executing it again skips `DuckDB` parser.
+
+    A *query* containing several statements is returned as is, so that executing it still runs all of them.
+
+    Args:
+        con (DuckDBPyConnection): The connection the *query* will be executed on.
+        q (str): The `SQL` *query* to parse.
+
+    Returns:
+        Statement | str: The parsed statement, or the *query* itself if it contains several statements.
+    """
+    match con.extract_statements(q):
+        case [statement]:
+            return statement
+        case _:
+            return q
+
+
+def _from_df(schema: type[Schema], df: IntoFrame | IntoLazyFrame) -> IntoLazyFrame:
     """Cast the input frame to the provided `Schema` and return the native frame.
 
     The caller **must** bind the result to a local variable named "_"
     so `DuckDB` can resolve it in SQL queries like `SELECT * FROM _`.
 
+    Nothing is collected here: the result is lazy whenever the input backend supports it,
+    so its select-and-cast plan is only executed by `DuckDB` replacement scan, in the same pass as the write.
+
     See https://duckdb.org/docs/stable/guides/python/sql_on_pandas for details.
 
     Args:
         schema (type[Schema]): The table's schema schema.
-        df (IntoFrameT | IntoLazyFrameT): The input dataframe.
+        df (IntoFrame | IntoLazyFrame): The input dataframe.
 
     Returns:
-        IntoFrameT | IntoLazyFrameT: The casted native DataFrame.
+        IntoLazyFrame: The casted native frame, lazy whenever the input backend supports it.
     """
-    return nw.from_native(df).lazy().pipe(schema.cast).to_native()
+    return schema.cast(df).to_native()
 
 
 class Table(Entry):
@@ -44,21 +69,32 @@ class Table(Entry):
 
     It is an `Entry` in a `DataBase` layout.
 
+    The table can be used from several threads at once: each thread queries through its own connection,
+    and statements that modify the database are serialized.
     """
 
-    __slots__ = ("_con",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
-    _con: DuckDBPyConnection
+    __slots__ = ("_pool",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
+    _pool: ConnexionPool
 
-    def __set_connexion__(self, con: DuckDBPyConnection) -> None:  # noqa: PLW3201
-        self._con = con
+    def __set_connexion__(self, pool: ConnexionPool) -> None:  # noqa: PLW3201
+        self._pool = pool
 
     def _execute(self, q: str) -> Self:
-        _ = self.connexion.unwrap().execute(q)
+        con = self.connexion.unwrap()
+        with self._pool.lock:
+            _ = con.execute(_parse(con, q))
+        return self
+
+    def _insert(self, df: IntoFrame | IntoLazyFrame, q: str) -> Self:
+        con = self.connexion.unwrap()
+        _ = _from_df(self.schema, df)
+        with self._pool.lock:
+            _executed = con.execute(_parse(con, q))
         return self
 
     @property
     def connexion(self) -> Result[DuckDBPyConnection, RuntimeError]:
-        """Get the `DuckDBPyConnection` of the table.
+        """Get the `DuckDBPyConnection` of the table for the current thread.
 
         `Ok(connection)` if the table is connected to a database, `Err(RuntimeError)` otherwise.
 
@@ -66,10 +102,12 @@ class Table(Entry):
             Result[DuckDBPyConnection, RuntimeError]: The connection result.
         """
         try:
-            return Ok(self._con)
+            return Ok(self._pool.get())
         except AttributeError:
             msg = "The table is not connected to any database."
             return Err(RuntimeError(msg))
+        except RuntimeError as e:
+            return Err(e)
 
     @property
     def relation(self) -> Result[DuckDBPyRelation, RuntimeError]:
@@ -166,9 +204,7 @@ class Table(Entry):
         Returns:
             Self: The table instance.
         """
-        _ = _from_df(self.schema, df)
-        _executed = self.connexion.unwrap().execute(qry.insert_into(self._name))
-        return self
+        return self._insert(df, qry.insert_into(self._name))
 
     def insert_or_replace(self, df: IntoFrame | IntoLazyFrame) -> Self:
         """Inserts rows from the dataframe.
@@ -181,9 +217,7 @@ class Table(Entry):
         Returns:
             Self: The table instance.
         """
-        _ = _from_df(self.schema, df)
-        _executed = self.connexion.unwrap().execute(qry.insert_or_replace(self._name))
-        return self
+        return self._insert(df, qry.insert_or_replace(self._name))
 
     def insert_or_ignore(self, df: IntoFrame | IntoLazyFrame) -> Self:
         """Inserts rows from the dataframe.
@@ -196,9 +230,7 @@ class Table(Entry):
         Returns:
             Self: The table instance.
         """
-        _ = _from_df(self.schema, df)
-        _executed = self.connexion.unwrap().execute(qry.insert_or_ignore(self._name))
-        return self
+        return self._insert(df, qry.insert_or_ignore(self._name))
 
     def summarize(self) -> DuckFrame:
         """Summarizes the table, returning statistics about its columns.
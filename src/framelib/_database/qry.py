@@ -1,9 +1,20 @@
-"""SQL queries for duckdb database operations."""
+"""SQL queries for duckdb database operations.
+
+Query builders are cached per arguments, so a table reuses the same string object on every call,
+whose hash is then already computed when it is looked up in the parsed statements cache.
+
+The caches are bounded. The `drop` builders are not cached at all:
+dropping is rare, and `DataBase.sync_schema` calls them with any table name found in the database.
+"""
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 _DATA = "_"
 """Placeholder table name for duckdb scope."""
+_CACHE_SIZE = 256
+"""Maximum number of queries kept per builder."""
 
 
 SHOW_TABLES = """--sql
@@ -33,24 +44,28 @@ def drop_if_exists(name: str) -> str:
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def create(name: str, schema_sql: str) -> str:
     return f"""--sql
     CREATE TABLE {name} ({schema_sql})
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def create_if_not_exist(name: str, schema_sql: str) -> str:
     return f"""--sql
     CREATE TABLE IF NOT EXISTS {name} ({schema_sql})
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def create_or_replace(name: str, schema_sql: str) -> str:
     return f"""--sql
     CREATE OR REPLACE TABLE {name} ({schema_sql})
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def insert_into(name: str) -> str:
     return f"""--sql
     INSERT INTO {name}
@@ -58,6 +73,7 @@ def insert_into(name: str) -> str:
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def insert_or_replace(name: str) -> str:
     return f"""--sql
     INSERT OR REPLACE INTO {name}
@@ -65,6 +81,7 @@ def insert_or_replace(name: str) -> str:
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def insert_or_ignore(name: str) -> str:
     return f"""--sql
     INSERT OR IGNORE INTO {name}
@@ -72,18 +89,21 @@ def insert_or_ignore(name: str) -> str:
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def truncate(name: str) -> str:
     return f"""--sql
     TRUNCATE TABLE {name};
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def summarize(name: str) -> str:
     return f"""--sql
     SUMMARIZE {name};
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def columns_schema(name: str) -> str:
     return f"""--sql
     SELECT *
@@ -92,6 +112,7 @@ def columns_schema(name: str) -> str:
     """
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def constraints(name: str) -> str:
     return f"""--sql
     SELECT constraint_name, constraint_type, constraint_column_usage.column_name
@@ -1,86 +1,114 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, override
+from typing import TYPE_CHECKING, ClassVar, override
 
 import polars as pl
 
 from ._core import Entry
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     from ._schema import Schema
 
+_ROW_GROUP_SIZE = 131_072
+"""Rows per Parquet row group, small enough for statistics pruning while keeping footers light."""
+_BATCH_SIZE = 65_536
+"""Rows buffered per chunk when reading a file in batches."""
 
-class File(Entry, ABC):
+
+class File(Entry):
     """A `File` represents a file in a folder.
 
     It's an `Entry` in a `Folder`.
 
     It can be associated with a `Schema` of `Columns` to define the structure of the data within the file.
 
-    Properties:
-        - `read`: A callable that reads the file and returns a `pl.DataFrame`.
-        - `scan`: A callable that scans the file and returns a `pl.LazyFrame`.
-        - `write`: A callable that writes a `pl.DataFrame` to the file.
+    Attributes:
+        read (Callable[..., pl.DataFrame]): Reads the file and returns a `pl.DataFrame`.
+        scan (Callable[..., pl.LazyFrame]): Scans the file and returns a `pl.LazyFrame`.
+        write (Callable[..., None]): Writes a `pl.DataFrame` to the file.
+
+    Formats supported by the Polars streaming engine also expose a `sink` attribute,
+    a callable that writes a `pl.LazyFrame` to the file without collecting it in memory first.
 
     Note:
-        The read/write/scan are implemented as properties who return partials as a way to keep original documentation, autocompletion and full compatibility with polars functions.
+        The read/write/scan are partials of the original polars functions, as a way to keep original documentation and full compatibility with them.
 
-        But they concretely act just like methods (i.e., you call them with parentheses and arguments).
+        They are set when the parent `Folder` sets the source of the file,
+        and concretely act just like methods (i.e., you call them with parentheses and arguments).
 
-        Hence, framelib sole responsibility is to provide the correct file path as the first argument.
+        framelib sole responsibility is to provide the correct file path as the first argument.
 
     Args:
         schema (type[T]): The schema schema associated with the file.
     """
 
-    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    _suffix: ClassVar[str]
+    __slots__ = ("read", "scan", "write")  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        cls._suffix = f".{cls.__name__.lower()}"
 
     @override
     def __set_source__(self, source: Path | str) -> None:
-        self.__source__: Path = Path(source, self._name).with_suffix(
-            f".{self.__class__.__name__.lower()}"
-        )
+        self.__source__: Path = Path(source, f"{self._name}{self._suffix}")
+        self.__set_io__()
 
-    @property
-    @abstractmethod
-    def read(self) -> Callable[..., pl.DataFrame]:
-        raise NotImplementedError
-
-    @property
-    @abstractmethod
-    def scan(self) -> Callable[..., pl.LazyFrame]:
-        raise NotImplementedError
-
-    @property
-    @abstractmethod
-    def write(self) -> Callable[..., None]:
+    def __set_io__(self) -> None:  # noqa: PLW3201
+        """Binds the read/scan/write callables to the source of the file."""
         raise NotImplementedError
 
 
 class Parquet(File):
-    """A Parquet file handler."""
+    """A Parquet file handler.
 
-    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    `write` and `sink` default to zstd compression with per-column statistics and row groups of 131 072 rows,
+    so that later scans can skip row groups based on pushed-down predicates.
 
-    @property
-    @override
-    def scan(self):  # noqa: ANN202
-        return partial(pl.scan_parquet, self.source, schema=self.schema.to_pl())
+    `scan` defaults to the `"prefiltered"` parallel strategy: columns used by a pushed-down filter are decoded first,
+    and the remaining columns only for the row groups and rows that survive it.
 
-    @property
-    @override
-    def read(self):  # noqa: ANN202
-        return partial(pl.read_parquet, self.source, schema=self.schema.to_pl())
+    Any of these defaults can be overridden by passing the keyword explicitly, e.g. `write(df, compression="snappy")`.
+    """
+
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    sink: Callable[..., pl.LazyFrame | None]
+    __slots__ = ("sink",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
 
-    @property
     @override
-    def write(self):  # noqa: ANN202
-        return partial(pl.DataFrame.write_parquet, file=self.source)
+    def __set_io__(self) -> None:
+        self.scan = partial(
+            pl.scan_parquet,
+            self.source,
+            schema=self.schema.to_pl(),
+            parallel="prefiltered",
+        )
+        self.read = partial(pl.read_parquet, self.source, schema=self.schema.to_pl())
+        self.write = partial(
+            pl.DataFrame.write_parquet,
+            file=self.source,
+            compression="zstd",
+            compression_level=3,
+            statistics=True,
+            row_group_size=_ROW_GROUP_SIZE,
+        )
+        self.sink = partial(
+            pl.LazyFrame.sink_parquet,
+            path=self.source,
+            compression="zstd",
+            compression_level=3,
+            statistics=True,
+            row_group_size=_ROW_GROUP_SIZE,
+        )
 
 
 class ParquetPartitioned(Parquet):
@@ -92,11 +120,28 @@ class ParquetPartitioned(Parquet):
 
     However, polars already handles this abstraction for us, so we can treat it as a single file.
 
+    When every partition column is in the schema, `scan` and `read` take their dtypes from it,
+    so the hive directories values are never inferred, and always match what `write` and `sink` partitioned by.
+    Otherwise, polars infers the dtypes of all the partition columns.
+
+    Warning:
+        `sink` relies on `pl.PartitionBy`, which polars marks as unstable: it may change in any polars release.
+
+    Attributes:
+        read (Callable[..., pl.DataFrame]): Reads all the partitions and returns a `pl.DataFrame`.
+        scan (Callable[..., pl.LazyFrame]): Scans all the partitions and returns a `pl.LazyFrame`.
+        write (Callable[..., None]): Writes a `pl.DataFrame`, split by the partition columns.
+        sink (Callable[..., pl.LazyFrame | None]): Streams a `pl.LazyFrame`, split by the partition columns.
+
     Args:
         partition_by (str | Sequence[str]): The column(s) to partition by.
         schema (type[Schema], optional): The schema schema associated with the file. Defaults to Schema.
     """
 
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    sink: Callable[..., pl.LazyFrame | None]
     _partition_by: str | Sequence[str]
     __slots__ = ("_partition_by",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
 
@@ -107,14 +152,60 @@ class ParquetPartitioned(Parquet):
     @override
     def __set_source__(self, source: Path | str) -> None:
         self.__source__: Path = Path(source, self._name)
+        self.__set_io__()
 
-    @property
     @override
-    def write(self):  # noqa: ANN202
-        return partial(
-            pl.DataFrame.write_parquet,
-            file=self.source,
-            partition_by=self._partition_by,
+    def __set_io__(self) -> None:
+        super().__set_io__()
+        schema = self.schema.to_pl()
+        keys = (
+            (self._partition_by,)
+            if isinstance(self._partition_by, str)
+            else self._partition_by
+        )
+        # polars needs every hive column in `hive_schema`, so keys outside the schema fall back to inference.
+        hive_schema = (
+            {key: schema[key] for key in keys}
+            if all(key in schema for key in keys)
+            else None
+        )
+        self.scan = partial(self.scan, hive_partitioning=True, hive_schema=hive_schema)
+        self.read = partial(self.read, hive_partitioning=True, hive_schema=hive_schema)
+        self.write = partial(self.write, partition_by=self._partition_by)
+        self.sink = partial(
+            self.sink,
+            path=pl.PartitionBy(self.source, key=self._partition_by),
+            mkdir=True,
+        )
+
+
+class Arrow(File):
+    """An Arrow IPC file handler.
+
+    Arrow IPC stores data in the same columnar layout Polars uses in memory, so reading it back is close to free.
+
+    Prefer `Parquet` for long-term storage, and `Arrow` for pipeline intermediates that are written then re-read.
+
+    Note:
+        `write` defaults to uncompressed batches, which allows `scan` and `read` to memory-map the file instead of decoding it.
+        Pass `compression="lz4"` or `compression="zstd"` to trade read speed for disk space.
+    """
+
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    sink: Callable[..., pl.LazyFrame | None]
+    __slots__ = ("sink",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
+
+    @override
+    def __set_io__(self) -> None:
+        self.scan = partial(pl.scan_ipc, self.source)
+        self.read = partial(pl.read_ipc, self.source)
+        self.write = partial(
+            pl.DataFrame.write_ipc, file=self.source, compression="uncompressed"
+        )
+        self.sink = partial(
+            pl.LazyFrame.sink_ipc, path=self.source, compression="uncompressed"
         )
 
 
@@ -122,24 +213,32 @@ class CSV(File):
     """Represents a CSV file.
 
     Acts as an interface with methods to scan, read, read in batches, and write CSV data using Polars functions.
-    """
 
-    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    Note:
+        `read_batched` runs the schema-typed scan on the streaming engine and yields `pl.DataFrame` chunks,
+        so parsing of the next chunk overlaps with the caller consuming the current one.
 
-    @property
-    @override
-    def scan(self):  # noqa: ANN202
-        return partial(pl.scan_csv, self.source, schema=self.schema.to_pl())
+        `chunk_size` is the number of rows buffered before a chunk is yielded (65 536 by default), not a byte size.
 
-    @property
-    @override
-    def read(self):  # noqa: ANN202
-        return partial(pl.read_csv, self.source, schema=self.schema.to_pl())
+    Warning:
+        `read_batched` relies on `pl.LazyFrame.collect_batches`, which polars marks as unstable:
+        it may change in any polars release.
+    """
+
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    read_batched: Callable[..., Iterator[pl.DataFrame]]
+    sink: Callable[..., pl.LazyFrame | None]
+    __slots__ = ("read_batched", "sink")  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
 
-    @property
     @override
-    def write(self):  # noqa: ANN202
-        return partial(pl.DataFrame.write_csv, file=self.source)
+    def __set_io__(self) -> None:
+        self.scan = partial(pl.scan_csv, self.source, schema=self.schema.to_pl())
+        self.read = partial(pl.read_csv, self.source, schema=self.schema.to_pl())
+        self.write = partial(pl.DataFrame.write_csv, file=self.source)
+        self.read_batched = partial(self.scan().collect_batches, chunk_size=_BATCH_SIZE)
+        self.sink = partial(pl.LazyFrame.sink_csv, path=self.source)
 
 
 class NDJson(File):
@@ -148,22 +247,18 @@ class NDJson(File):
     Provides properties to scan, read, and write NDJSON data using Polars functions.
     """
 
-    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
-
-    @property
-    @override
-    def scan(self):  # noqa: ANN202
-        return partial(pl.scan_ndjson, self.source, schema=self.schema.to_pl())
-
-    @property
-    @override
-    def read(self):  # noqa: ANN202
-        return partial(pl.read_ndjson, self.source, schema=self.schema.to_pl())
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    sink: Callable[..., pl.LazyFrame | None]
+    __slots__ = ("sink",)  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
 
-    @property
     @override
-    def write(self):  # noqa: ANN202
-        return partial(pl.DataFrame.write_ndjson, file=self.source)
+    def __set_io__(self) -> None:
+        self.scan = partial(pl.scan_ndjson, self.source, schema=self.schema.to_pl())
+        self.read = partial(pl.read_ndjson, self.source, schema=self.schema.to_pl())
+        self.write = partial(pl.DataFrame.write_ndjson, file=self.source)
+        self.sink = partial(pl.LazyFrame.sink_ndjson, path=self.source)
 
 
 class Json(File):
@@ -178,19 +273,17 @@ class Json(File):
         compared to reading the entire file into memory.
     """
 
-    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute]
+    read: Callable[..., pl.DataFrame]
+    scan: Callable[..., pl.LazyFrame]
+    write: Callable[..., None]
+    __slots__ = ()  # pyright: ignore[reportUnannotatedClassAttribute, reportIncompatibleUnannotatedOverride]
 
-    @property
     @override
-    def scan(self) -> Callable[[], pl.LazyFrame]:
-        raise NotImplementedError
+    def __set_io__(self) -> None:
+        self.scan = _scan_json
+        self.read = partial(pl.read_json, self.source, schema=self.schema.to_pl())
+        self.write = partial(pl.DataFrame.write_json, file=self.source)
 
-    @property
-    @override
-    def read(self):  # noqa: ANN202
-        return partial(pl.read_json, self.source, schema=self.schema.to_pl())
 
-    @property
-    @override
-    def write(self):  # noqa: ANN202
-        return partial(pl.DataFrame.write_json, file=self.source)
+def _scan_json(*_args: object, **_kwargs: object) -> pl.LazyFrame:
+    raise NotImplementedError
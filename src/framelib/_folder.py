@@ -15,6 +15,9 @@ class Folder(Layout[File]):
     It's a `Schema` of `File` entries.
     """
 
+    _tree: tuple[tuple[Path, ...], str] | None = None
+    """The cached tree, keyed by the sources of the files it was built from."""
+
     def __new__(cls) -> None:
         msg = "Folder cannot be instantiated directly."
         raise TypeError(msg)
@@ -24,14 +27,9 @@ class Folder(Layout[File]):
         if not hasattr(cls, SOURCE):
             cls.__source__: Path = Path()
 
-        cls.__source__ = cls.__source__.joinpath(cls.__name__.lower())
-        (
-            cls
-            .entries()
-            .values()
-            .iter()
-            .for_each(lambda file: file.__set_source__(cls.source()))
-        )
+        cls.__source__ = source = cls.__source__.joinpath(cls.__name__.lower())
+        for file in cls.entries().values():
+            file.__set_source__(source)
 
     @classmethod
     def source(cls) -> Path:
@@ -46,6 +44,8 @@ class Folder(Layout[File]):
     def show_tree(cls) -> str:
         """Show the folder structure as a tree.
 
+        The tree is built on the first call, and rebuilt after a subclass re-sources the inherited files.
+
         Returns:
             str: The folder structure.
 
@@ -62,4 +62,17 @@ class Folder(Layout[File]):
 
         ```
         """
-        return TreeBuilder.from_mro(cls.mro()).build()
+        # Inherited files are shared with the parents and their other subclasses, which re-source them.
+        sources = tuple(
+            file.source
+            for folder in cls.__mro__
+            if issubclass(folder, Folder)
+            for file in folder.entries().values()
+        )
+        match cls._tree:
+            case (key, tree) if key == sources:
+                return tree
+            case _:
+                tree = TreeBuilder.from_mro(cls.mro()).build()
+                cls._tree = (sources, tree)
+                return tree
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypeIs, overload
+from typing import TYPE_CHECKING, ClassVar, overload
 
 import narwhals as nw
 import polars as pl
-from pyochain import Dict, Iter, Seq, Set, Vec
+from pyochain import Dict
 
 from ._columns import Column
-from ._core import Layout
+from ._core import BaseEntry, Layout
 from ._database._constraints import KeysConstraints, KWord
 
 if TYPE_CHECKING:
-    from narwhals.typing import IntoLazyFrameT, LazyFrameT
+    from narwhals.typing import IntoFrame, IntoLazyFrame, IntoLazyFrameT, LazyFrameT
+
+_PRIMARY_KEY = f" {KWord.PRIMARY_KEY}"
+_UNIQUE = f" {KWord.UNIQUE}"
+_NOT_NULL = f" {KWord.NOT_NULL}"
 
 
 class Schema(Layout[Column]):
@@ -20,7 +24,14 @@ class Schema(Layout[Column]):
     Used to define the schema of a Table or a File.
     """
 
-    _constraints: KeysConstraints
+    _entry_type: ClassVar[type[BaseEntry]] = Column
+    _entries: Dict[str, Column] = Dict({})
+    _constraints: KeysConstraints = KeysConstraints.from_cols(())
+    _pl_schema: pl.Schema = pl.Schema()
+    _sql: str = ""
+    _cast_exprs: tuple[nw.Expr, ...] = ()
+    _pl_cast_exprs: tuple[pl.Expr, ...] = ()
+    _pl_cast_exprs_strict_false: tuple[pl.Expr, ...] = ()
 
     def __new__(cls) -> None:
         msg = "Schema cannot be instantiated directly."
@@ -28,10 +39,25 @@ class Schema(Layout[Column]):
 
     def __init_subclass__(cls) -> None:
         super().__init_subclass__()
-        cls._entries: Dict[str, Column] = _entries_from_mro(cls)
-        cls._constraints = (
-            cls.entries().values().iter().collect(Set).into(KeysConstraints.from_cols)
-        )
+        if _inherits_columns(cls):
+            return
+        columns = tuple(cls._entries.values())
+        cls._constraints = KeysConstraints.from_cols(columns)
+        cls._sql = _build_sql(columns, cls._constraints)
+        pl_schema: list[tuple[str, pl.DataType]] = []
+        cast_exprs: list[nw.Expr] = []
+        pl_cast_exprs: list[pl.Expr] = []
+        pl_cast_exprs_strict_false: list[pl.Expr] = []
+        for col in columns:
+            pl_col, pl_dtype = col.pl_col, col.pl_dtype
+            pl_schema.append((col.name, pl_dtype))
+            cast_exprs.append(col.nw_col.cast(col.nw_dtype))
+            pl_cast_exprs.append(pl_col.cast(pl_dtype))
+            pl_cast_exprs_strict_false.append(pl_col.cast(pl_dtype, strict=False))
+        cls._pl_schema = pl.Schema(pl_schema)
+        cls._cast_exprs = tuple(cast_exprs)
+        cls._pl_cast_exprs = tuple(pl_cast_exprs)
+        cls._pl_cast_exprs_strict_false = tuple(pl_cast_exprs_strict_false)
 
     @classmethod
     def constraints(cls) -> KeysConstraints:
@@ -49,49 +75,18 @@ class Schema(Layout[Column]):
         Returns:
             str: The SQL schema definition.
         """
-        composite_pk = cls._constraints.primary.filter(lambda pk: pk.is_composite())
-        composite_unique = cls._constraints.uniques.filter(lambda u: u.is_composite())
-
-        def _col_sql(col: Column) -> str:
-            parts = Vec([col.sql_col])
-            if col.primary_key and composite_pk.is_none():
-                parts.append(KWord.PRIMARY_KEY)
-            if col.unique and composite_unique.is_none():
-                parts.append(KWord.UNIQUE)
-            if not col.nullable:
-                parts.append(KWord.NOT_NULL)
-            return parts.iter().join(" ")
-
-        table_constraints = (
-            Iter((composite_pk, composite_unique))
-            .filter(lambda constr: constr.is_some())
-            .map(lambda constr: constr.unwrap().to_sql())
-        )
-        return (
-            cls
-            .entries()
-            .values()
-            .iter()
-            .map(_col_sql)
-            .chain(table_constraints)
-            .join(", ")
-        )
+        return cls._sql
 
     @classmethod
     def to_pl(cls) -> pl.Schema:
         """Get the schema as a Polars schema.
 
+        It is shared by every caller: do not mutate it.
+
         Returns:
             pl.Schema: The Polars schema definition.
         """
-        return (
-            cls
-            .entries()
-            .items()
-            .iter()
-            .map_star(lambda name, c: (name, c.pl_dtype))
-            .collect(pl.Schema)
-        )
+        return cls._pl_schema
 
     @overload
     @classmethod
@@ -105,10 +100,14 @@ class Schema(Layout[Column]):
     @classmethod
     def cast(cls, df: pl.DataFrame) -> nw.LazyFrame[pl.LazyFrame]: ...
 
+    @overload
+    @classmethod
+    def cast(cls, df: IntoFrame) -> nw.LazyFrame[IntoLazyFrame]: ...
+
     @classmethod
     def cast(
-        cls, df: IntoLazyFrameT | LazyFrameT | pl.DataFrame
-    ) -> LazyFrameT | nw.LazyFrame[IntoLazyFrameT]:
+        cls, df: IntoLazyFrameT | LazyFrameT | IntoFrame
+    ) -> LazyFrameT | nw.LazyFrame[IntoLazyFrameT] | nw.LazyFrame[IntoLazyFrame]:
         """Casts the input DataFrame to match the schema.
 
         Steps:
@@ -118,11 +117,14 @@ class Schema(Layout[Column]):
 
         Use `.to_native()` to convert back to the native DataFrame type.
 
+        Narwhals frames skip the generic `from_native(...).lazy()` dispatch,
+        and `polars` frames, the common case, are casted with native expressions before being wrapped.
+
         Args:
-            df (IntoLazyFrameT | LazyFrameT | pl.DataFrame): The input DataFrame.
+            df (IntoLazyFrameT | LazyFrameT | IntoFrame): The input DataFrame.
 
         Returns:
-            LazyFrameT | nw.LazyFrame[IntoLazyFrameT]: The casted narwhals.LazyFrame.
+            LazyFrameT | nw.LazyFrame[IntoLazyFrameT] | nw.LazyFrame[IntoLazyFrame]: The casted narwhals.LazyFrame.
 
         Examples:
         ```python
@@ -155,18 +157,18 @@ class Schema(Layout[Column]):
         ```
 
         """
-        return (
-            nw
-            .from_native(df)  # pyright: ignore[reportUnknownMemberType]
-            .lazy()
-            .select(
-                cls
-                .entries()
-                .values()
-                .iter()
-                .map(lambda col: col.nw_col.cast(col.nw_dtype))
-            )
-        )
+        match df:
+            case nw.LazyFrame():
+                return df.select(cls._cast_exprs)  # pyright: ignore[reportUnknownMemberType]
+            case pl.LazyFrame() | pl.DataFrame():
+                return nw.from_native(df.lazy().select(cls._pl_cast_exprs))  # pyright: ignore[reportUnknownMemberType]
+            case _:
+                return (  # pyright: ignore[reportReturnType]
+                    nw
+                    .from_native(df)  # pyright: ignore[reportUnknownMemberType]
+                    .lazy()
+                    .select(cls._cast_exprs)
+                )
 
     @classmethod
     def cast_strict_false(cls, df: pl.LazyFrame | pl.DataFrame) -> pl.LazyFrame:
@@ -181,45 +183,54 @@ class Schema(Layout[Column]):
         Returns:
             pl.LazyFrame: The casted `polars.LazyFrame`.
         """
-        return df.lazy().select(  # pyright: ignore[reportUnknownMemberType]
-            cls
-            .entries()
-            .values()
-            .iter()
-            .map(lambda c: c.pl_col.cast(c.pl_dtype, strict=False))
-        )
-
-
-def _entries_from_mro(cls: type) -> Dict[str, Column]:
-    """Constructs the entries dictionary from the class MRO.
-
-    Steps:
-        - Create an Iterator over the MRO
-        - Filter only Schema subclasses (excluding the parent Schema class itself)
-        - Reverse the order to have the base classes first
-        - For each base class, filter its attributes to keep only Column entries
-        - Extract the items (name, Column) as tuples
-        - Flatten the list of tuples into a single iterable
+        return df.lazy().select(cls._pl_cast_exprs_strict_false)  # pyright: ignore[reportUnknownMemberType]
+
+
+def _inherits_columns(cls: type[Schema]) -> bool:
+    """Checks if a schema only inherits the columns of a single parent schema.
+
+    Such a schema can reuse the caches of its parent, found through the class attributes lookup, instead of rebuilding them.
 
     Args:
-        cls (type): The schema class.
+        cls (type[Schema]): The schema being defined.
 
     Returns:
-        Dict[str, Column]: The final entries as a dictionary.
+        bool: True if the schema has a single `Schema` subclass as base, and declares no column of its own.
     """
+    match cls.__bases__:
+        case (parent,) if parent is not Schema and issubclass(parent, Schema):
+            return not any(isinstance(obj, Column) for obj in vars(cls).values())  # pyright: ignore[reportAny]
+        case _:
+            return False
 
-    def _is_subclass_of_schema(c: type) -> TypeIs[type[Schema]]:
-        return issubclass(c, Schema) and c is not Schema
 
-    def _is_column(v: object) -> TypeIs[Column]:
-        return isinstance(v, Column)
+def _build_sql(columns: tuple[Column, ...], constraints: KeysConstraints) -> str:
+    """Builds the SQL columns and table constraints definition of a schema.
 
-    return (
-        Iter(cls.mro())
-        .filter(_is_subclass_of_schema)
-        .collect(Seq)
-        .rev()
-        .flat_map(lambda base: base.__dict__.items())
-        .filter_star(lambda _, v: _is_column(v))  # pyright: ignore[reportAny]
-        .collect(Dict)
+    Composite keys are declared as table constraints, otherwise the keyword is appended to the column itself.
+
+    Args:
+        columns (tuple[Column, ...]): The columns of the schema, in definition order.
+        constraints (KeysConstraints): The keys constraints of the schema.
+
+    Returns:
+        str: The SQL schema definition.
+    """
+    composite_pk = constraints.primary.filter(lambda pk: pk.is_composite())
+    composite_unique = constraints.uniques.filter(lambda u: u.is_composite())
+    inline_pk = composite_pk.is_none()
+    inline_unique = composite_unique.is_none()
+
+    def _col_sql(col: Column) -> str:
+        primary_key = _PRIMARY_KEY if col.primary_key and inline_pk else ""
+        unique = _UNIQUE if col.unique and inline_unique else ""
+        not_null = "" if col.nullable else _NOT_NULL
+        return f"{col.sql_col}{primary_key}{unique}{not_null}"
+
+    sql = [_col_sql(col) for col in columns]
+    sql.extend(
+        constr.unwrap().to_sql()
+        for constr in (composite_pk, composite_unique)
+        if constr.is_some()
     )
+    return ", ".join(sql)
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import StrEnum
-from typing import TYPE_CHECKING, Self, TypeIs
+from typing import TYPE_CHECKING, Self
 
-from pyochain import Iter, Option, Seq, Set, Some, Vec, then_if_true
+from pyochain import Iter, Seq, Set
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -44,33 +44,23 @@ class TreeBuilder:
     def from_mro(cls, mro: Sequence[type]) -> Self:
         from ._folder import Folder
 
-        def _is_subclass[T](cls: type, parent: type[T]) -> TypeIs[type[T]]:
-            return issubclass(cls, parent) and cls is not parent
-
-        return (
-            Iter(mro)
-            .filter(lambda cls: _is_subclass(cls, Folder))
-            .collect(Seq)
-            .into(lambda folders: cls(folders, folders.last().source()))
-        )
+        folders = Seq([c for c in mro if c is not Folder and issubclass(c, Folder)])
+        return cls(folders, folders.last().source())
 
     def build(self) -> str:
-        def _add_to_tree(folder: File) -> PyoIterator[Path]:
-            def _is_addable(path: Path) -> Option[Path]:
-                return then_if_true(
-                    path.parent, predicate=lambda p: p.as_posix() != "."
-                )
+        root_parts = self.root.parts
+        root_len = len(root_parts)
 
-            try:
-                return (
-                    Some(folder.source.relative_to(self.root).parent)
-                    .into(Iter.successors, succ=_is_addable)
-                    .map(self.root.joinpath)
-                )
-            except ValueError:
+        def _add_to_tree(folder: File) -> PyoIterator[Path]:
+            parts = folder.source.parts
+            if parts[:root_len] != root_parts:
                 return Iter(())
+            dirs = parts[root_len:-1]
+            return Iter(range(len(dirs), 0, -1)).map(
+                lambda depth: self.root.joinpath(*dirs[:depth])
+            )
 
-        return (
+        lines = (
             self.folders
             .iter()
             .flat_map(lambda f: f.entries().values())
@@ -78,17 +68,21 @@ class TreeBuilder:
             .insert(self.root)
             .collect(Set)
             .into(Structure.from_folders, self.folders)
-            .recurse(self.root)
-            .collect(Seq)
-            .then(lambda lines: f"{self.root}\n{lines.iter().join('\n')}")
-            .unwrap_or(f"{self.root}\n")
+            .lines(self.root)
         )
+        return f"{self.root}\n{'\n'.join(lines)}"
 
 
 @dataclass(slots=True)
 class Structure:
     all_paths: Set[Path]
     dir_paths: Set[Path]
+    children: dict[Path, list[Path]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.children = {}
+        for path in sorted(self.all_paths):
+            self.children.setdefault(path.parent, []).append(path)
 
     @classmethod
     def from_folders(cls, dir_paths: Set[Path], all_folders: Seq[type[Folder]]) -> Self:
@@ -103,25 +97,25 @@ class Structure:
             .into(cls, dir_paths)
         )
 
-    def _childrens(self, current: Path) -> Vec[Path]:
-        return self.all_paths.iter().filter(lambda path: path.parent == current).sort()
-
-    def recurse(self, current: Path, prefix: str = "") -> PyoIterator[str]:
-        childrens = self._childrens(current)
-        children_len: int = childrens.len()
-
-        def _entries(idx: int, node: Path) -> PyoIterator[str]:
-            is_last = idx == children_len - 1
-            line = f"{prefix}{Leaf.line(is_last=is_last)}{node.name}"
-            match node in self.dir_paths:
-                case True:  # Directory: print and recurse into it
-                    return Iter.once(line).chain(
-                        self.recurse(
-                            node,
-                            f"{prefix}{Tree.line(is_last=is_last)}",
-                        )
-                    )
-                case False:  # File: just print
-                    return Iter.once(line)
-
-        return childrens.iter().enumerate().map_star(_entries).flatten()
+    def lines(self, root: Path) -> list[str]:
+        lines: list[str] = []
+        stack: list[tuple[Path, str, bool]] = []
+        self._push_childrens(stack, root, "")
+        while stack:
+            node, prefix, is_last = stack.pop()
+            lines.append(f"{prefix}{Leaf.line(is_last=is_last)}{node.name}")
+            if node in self.dir_paths:
+                self._push_childrens(
+                    stack, node, f"{prefix}{Tree.line(is_last=is_last)}"
+                )
+        return lines
+
+    def _push_childrens(
+        self, stack: list[tuple[Path, str, bool]], current: Path, prefix: str
+    ) -> None:
+        """Pushes the childrens of `current` in reverse order, so they are popped in sorted order."""
+        childrens = self.children.get(current, [])
+        last = len(childrens) - 1
+        stack.extend(
+            (childrens[idx], prefix, idx == last) for idx in range(last, -1, -1)
+        )
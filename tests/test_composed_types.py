@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from enum import Enum as StdEnum
 
+import narwhals as nw
 import polars as pl
 from pyochain import Dict, Iter, Range, Set
 
@@ -181,3 +182,28 @@ def test_list_of_lists_of_struct_sql() -> None:
     sql = lst_2d.sql_type
     assert "STRUCT" in sql
     assert "[][]" in sql
+
+
+def test_enum_dtypes_follow_input_order() -> None:
+    """Enum dtypes keep the categories in input order, without duplicates."""
+    status = fl.Enum(["open", "closed", "open"])
+    other = fl.Enum(("open", "closed"))
+
+    assert status.pl_dtype == other.pl_dtype == pl.Enum(["open", "closed"])
+    assert status.nw_dtype == other.nw_dtype
+    assert status.pl_dtype.categories.to_list() == ["open", "closed"]
+    assert fl.Enum(["closed", "open"]).pl_dtype.categories.to_list() == [
+        "closed",
+        "open",
+    ]
+
+
+def test_nested_composed_dtypes() -> None:
+    """Struct, Array and List nest the dtypes of their inner columns."""
+    struct = fl.Struct({"inner": fl.Struct({"x": fl.List(fl.Int64())})})
+    array = fl.Array(inner=fl.Float32(), shape=(2, 2))
+
+    assert struct.nw_dtype == nw.Struct({"inner": nw.Struct({"x": nw.List(nw.Int64)})})
+    assert array.nw_dtype == nw.Array(nw.Float32, (2, 2))
+    assert struct.pl_dtype == pl.Struct({"inner": pl.Struct({"x": pl.List(pl.Int64)})})
+    assert array.pl_dtype == pl.Array(pl.Float32, (2, 2))
@@ -7,7 +7,7 @@ from pathlib import Path
 import duckdb
 import polars as pl
 import pytest
-from pyochain import Dict, Set
+from pyochain import Dict, ResultUnwrapError, Set
 
 import framelib as fl
 
@@ -287,6 +287,30 @@ def test_db_sql_execution_within_context(tmp_path: Path) -> None:
         assert result.get_column("avg_y").to_list()[0] == pytest.approx(2.5)  # pyright: ignore[reportUnknownMemberType]
 
 
+def test_db_sql_outside_context_raises(tmp_path: Path) -> None:
+    """Raw SQL queries fail with a clear error outside of a connection context."""
+
+    class S(fl.Schema):
+        x: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        data: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    with pytest.raises(RuntimeError, match="not connected"):
+        _ = Project.db.sql("SELECT 1")
+    with Project.db:
+        _ = Project.db.sql("SELECT 1")
+    with pytest.raises(RuntimeError, match="not connected"):
+        _ = Project.db.sql("SELECT 1")
+    assert Project.db.data.connexion.is_err()
+
+
 def test_db_show_tables_reflects_schema(tmp_path: Path) -> None:
     """show_tables reflects all tables created from schema."""
 
@@ -319,6 +343,70 @@ def test_db_show_tables_reflects_schema(tmp_path: Path) -> None:
         assert "table_two" in table_names
 
 
+def test_db_sync_schema_drops_stale_tables(tmp_path: Path) -> None:
+    """sync_schema drops every table not declared in the database, and keeps the declared ones."""
+
+    class S1(fl.Schema):
+        a: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        table_one: fl.Table = fl.Table(schema=S1)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    with Project.db:
+        _ = Project.db.table_one.create_or_replace()
+        for name in ("stale_one", "stale_two"):
+            _ = Project.db.connexion.execute(f"CREATE TABLE {name} (x INTEGER)")
+        _ = Project.db.sync_schema()
+        tables = Set[str](Project.db.show_tables().collect().get_column("name"))
+        assert tables == Set(("table_one",))
+        _ = Project.db.table_one.insert_into(pl.DataFrame({"a": [1]}))
+        # Nothing is stale anymore, so no transaction is opened inside the caller's one.
+        _ = Project.db.connexion.begin()
+        _ = Project.db.sync_schema()
+        _ = Project.db.connexion.commit()
+
+
+def test_db_sync_schema_rolls_back_on_interrupt(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """sync_schema rolls back the drops already done when interrupted, even by a non-DuckDB error."""
+
+    class S1(fl.Schema):
+        a: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        table_one: fl.Table = fl.Table(schema=S1)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+    calls: list[str] = []
+
+    def _interrupted_drop(name: str) -> str:
+        calls.append(name)
+        if len(calls) > 1:
+            raise KeyboardInterrupt
+        return f"DROP TABLE IF EXISTS {name}"
+
+    monkeypatch.setattr("framelib._database.qry.drop_if_exists", _interrupted_drop)
+    with Project.db:
+        _ = Project.db.table_one.create_or_replace()
+        for name in ("stale_one", "stale_two"):
+            _ = Project.db.connexion.execute(f"CREATE TABLE {name} (x INTEGER)")
+        with pytest.raises(KeyboardInterrupt):
+            _ = Project.db.sync_schema()
+        tables = Set[str](Project.db.show_tables().collect().get_column("name"))
+        assert tables == Set(("table_one", "stale_one", "stale_two"))
+
+
 def test_db_concurrent_decorated_functions_different_dbs(tmp_path: Path) -> None:
     """Different databases in same folder can be used independently."""
 
@@ -388,6 +476,131 @@ def test_db_manual_connect_close(tmp_path: Path) -> None:
     assert not Project.db.close().is_connected
 
 
+def _is_released(path: Path) -> bool:
+    """Whether the database file can be opened with another configuration, i.e. no connection holds it."""
+    try:
+        duckdb.connect(path, read_only=True).close()
+    except duckdb.ConnectionException:
+        return False
+    return True
+
+
+def test_db_file_released_after_context(tmp_path: Path) -> None:
+    """By default, the database file is released as soon as the outermost context exits."""
+
+    class S(fl.Schema):
+        v: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    with Project.db as db:
+        _ = db.t.create_or_replace().insert_into(pl.DataFrame({"v": [1]}))
+        with Project.db:
+            pass
+        assert not _is_released(Project.db.source)
+    assert _is_released(Project.db.source)
+
+
+def test_db_keep_alive_across_contexts(tmp_path: Path) -> None:
+    """A `keep_alive` database keeps the file open between contexts until `shutdown` is called."""
+
+    class S(fl.Schema):
+        v: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        keep_alive = True
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    with Project.db as db:
+        _ = db.t.create_or_replace().insert_into(pl.DataFrame({"v": [1]}))
+    assert not _is_released(Project.db.source)
+
+    with Project.db as db:
+        assert db.t.read().get_column("v").to_list() == [1]
+
+    assert _is_released(Project.db.shutdown().source)
+    with Project.db as db:
+        assert db.t.read().get_column("v").to_list() == [1]
+    assert _is_released(Project.db.shutdown().source)
+
+
+def test_db_tables_usable_from_threads(tmp_path: Path) -> None:
+    """Worker threads get their own connection and can read and write concurrently."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    class S(fl.Schema):
+        v: fl.Int64 = fl.Int64()
+
+    class MyDB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: MyDB = MyDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    def _work(v: int) -> int:
+        assert Project.db.t.connexion.unwrap() is not Project.db.connexion
+        _ = Project.db.t.insert_into(pl.DataFrame({"v": [v]}))
+        return Project.db.t.read().height
+
+    with Project.db as db:
+        _ = db.t.create_or_replace()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            heights = list(pool.map(_work, range(8)))
+        assert db.t.connexion.unwrap() is db.connexion
+        assert sorted(db.t.read().get_column("v").to_list()) == list(range(8))
+    assert all(1 <= h <= 8 for h in heights)
+
+
+def test_db_shared_tables_use_their_own_database(tmp_path: Path) -> None:
+    """Tables inherited from a parent database are bound to the instance they are accessed through."""
+
+    class S(fl.Schema):
+        v: fl.Int64 = fl.Int64()
+
+    class BaseDB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class ExtDB(BaseDB):
+        u: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        core: BaseDB = BaseDB()
+        ext: ExtDB = ExtDB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    with Project.core as core:
+        assert core.t.connexion.unwrap() is core.connexion
+        assert core.entries().get_item("t").unwrap() is core.t
+        _ = core.t.create_or_replace()
+    assert BaseDB.entries().get_item("t").unwrap() is BaseDB.t
+    with pytest.raises(ResultUnwrapError):
+        _ = BaseDB.t.create_or_replace()
+
+    with Project.core as core, Project.ext as ext:
+        _ = ext.t.create_or_replace()
+        _ = core.t.insert_into(pl.DataFrame({"v": [1]}))
+        assert core.t.read().height == 1
+        assert ext.t.read().height == 0
+
+
 def test_schema_composite_pk_duckdb_integration(tmp_path: Path) -> None:
     """Composite PK should work correctly with DuckDB insert_or_replace."""
 
@@ -48,3 +48,132 @@ def test_csv_write_and_read(tmp_path: Path) -> None:
     df2 = Project.data.read()
     assert df2.shape == (2, 2)
     assert df2.get_column("id").to_list() == [10, 20]
+
+
+def test_parquet_write_defaults_and_overrides(tmp_path: Path) -> None:
+    """`Parquet.write` and `Parquet.sink` use zstd by default, and keyword arguments still override it."""
+    import pyarrow.parquet as pq
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        data: fl.Parquet = fl.Parquet(schema=S)
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+    df = pl.DataFrame({"id": range(10)})
+
+    df.pipe(Project.data.write)
+    meta = pq.ParquetFile(Project.data.source).metadata
+    assert meta.row_group(0).column(0).compression == "ZSTD"
+    assert meta.row_group(0).column(0).statistics is not None
+
+    Project.data.write(df, compression="snappy")
+    meta = pq.ParquetFile(Project.data.source).metadata
+    assert meta.row_group(0).column(0).compression == "SNAPPY"
+
+    df.lazy().pipe(Project.data.sink)
+    meta = pq.ParquetFile(Project.data.source).metadata
+    assert meta.row_group(0).column(0).compression == "ZSTD"
+
+
+def test_arrow_write_scan_and_read(tmp_path: Path) -> None:
+    """Write an Arrow IPC file, then scan and read it back via the `Arrow` File handler."""
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+        name: fl.String = fl.String()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        data: fl.Arrow = fl.Arrow(schema=S)
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+    assert Project.data.source.name == "data.arrow"
+
+    pl.DataFrame({"id": [1, 2], "name": ["alice", "bob"]}).pipe(Project.data.write)
+    assert Project.data.scan().collect().get_column("id").to_list() == [1, 2]
+    assert Project.data.read().get_column("name").to_list() == ["alice", "bob"]
+
+
+def test_sink_streams_lazyframes(tmp_path: Path) -> None:
+    """`sink` writes a LazyFrame without collecting it, for every streaming-capable format."""
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+        name: fl.String = fl.String()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        pq: fl.Parquet = fl.Parquet(schema=S)
+        ipc: fl.Arrow = fl.Arrow(schema=S)
+        csv: fl.CSV = fl.CSV(schema=S)
+        ndjson: fl.NDJson = fl.NDJson(schema=S)
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+    lf = pl.LazyFrame({"id": [1, 2], "name": ["alice", "bob"]})
+
+    for file in (Project.pq, Project.ipc, Project.csv, Project.ndjson):
+        lf.pipe(file.sink)
+        assert file.read().get_column("id").to_list() == [1, 2]
+
+
+def test_parquet_partitioned_sink(tmp_path: Path) -> None:
+    """`ParquetPartitioned.sink` writes one hive directory per partition value."""
+
+    class S(fl.Schema):
+        key: fl.String = fl.String()
+        val: fl.Int64 = fl.Int64()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        data: fl.ParquetPartitioned = fl.ParquetPartitioned("key", schema=S)
+
+    pl.LazyFrame({"key": ["a", "b", "a"], "val": [1, 2, 3]}).pipe(Project.data.sink)
+
+    assert Project.data.source.joinpath("key=a").is_dir()
+    assert Project.data.source.joinpath("key=b").is_dir()
+    assert Project.data.read().sort("val").get_column("val").to_list() == [1, 2, 3]
+    assert Project.data.scan().filter(pl.col("key") == "a").collect().sort(
+        "val"
+    ).get_column("val").to_list() == [1, 3]
+
+
+def test_parquet_partitioned_key_outside_schema(tmp_path: Path) -> None:
+    """A partition key that is not a schema column is left to hive type inference."""
+
+    class S(fl.Schema):
+        val: fl.Int64 = fl.Int64()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        data: fl.ParquetPartitioned = fl.ParquetPartitioned("region", schema=S)
+
+    pl.LazyFrame({"region": ["eu", "us", "eu"], "val": [1, 2, 3]}).pipe(
+        Project.data.sink
+    )
+
+    df = Project.data.read().sort("val")
+    assert df.schema["val"] == pl.Int64
+    assert df.get_column("region").to_list() == ["eu", "us", "eu"]
+
+
+def test_csv_read_batched(tmp_path: Path) -> None:
+    """`CSV.read_batched` yields schema-typed chunks covering the whole file."""
+
+    class S(fl.Schema):
+        id: fl.Int32 = fl.Int32()
+        val: fl.String = fl.String()
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        data: fl.CSV = fl.CSV(schema=S)
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+    pl.DataFrame({"id": range(100), "val": ["x"] * 100}).pipe(Project.data.write)
+
+    batches = list(Project.data.read_batched(chunk_size=30))
+    assert len(batches) > 1
+    assert all(batch.schema == S.to_pl() for batch in batches)
+    assert pl.concat(batches).get_column("id").to_list() == list(range(100))
@@ -144,6 +144,47 @@ def test_folder_tree_output_structure(tmp_path: Path) -> None:
     assert "├──" in tree or "└──" in tree or "─" in tree, f"No tree syntax in:\n{tree}"
 
 
+def test_folder_show_tree_follows_subclass_sources(tmp_path: Path) -> None:
+    """show_tree reflects the file sources, even when a subclass re-sources them after a first call."""
+    schema = _simple_schema()
+
+    class Base(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        file1: fl.CSV = fl.CSV(schema=schema)
+
+    assert "derived" not in Base.show_tree()
+
+    class Derived(Base):
+        file2: fl.Json = fl.Json(schema=schema)
+
+    assert "file2.json" not in Base.show_tree()
+    assert "file2.json" in Derived.show_tree()
+    assert Base.file1.source.parent.name == "derived"
+    assert "derived" in Base.show_tree()
+
+
+def test_folder_show_tree_follows_sibling_sources(tmp_path: Path) -> None:
+    """show_tree reflects the file sources after a sibling subclass re-sources the shared files."""
+    schema = _simple_schema()
+
+    class Base(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        f1: fl.CSV = fl.CSV(schema=schema)
+
+    class A(Base):
+        pass
+
+    assert A.f1.source.parent.name == "a"
+    assert "── a" in A.show_tree()
+
+    class B(Base):
+        pass
+
+    assert A.f1.source.parent.name == "b"
+    assert "── b" in A.show_tree()
+    assert "── a" not in A.show_tree()
+
+
 # ============================================================================
 # File Source Path Tests: Complete Path Verification
 # ============================================================================
@@ -35,6 +35,8 @@ def test_slots() -> None:
             "sub_value": fl.Float64(),
         })
         dec: fl.Decimal = fl.Decimal(precision=10, scale=2)
+        tags: fl.List = fl.List(fl.String())
+        label: fl.Categorical = fl.Categorical()
 
     class MyDb(fl.DataBase):  # DataBase, being both a layout AND entry, can't use slots
         table1: fl.Table = fl.Table(MySchema)
@@ -47,6 +49,7 @@ def test_slots() -> None:
             partition_by="date", schema=MySchema
         )
         file5: fl.Json = fl.Json(MySchema)
+        file6: fl.Arrow = fl.Arrow(MySchema)
 
     MySchema.entries().values().iter().for_each(_check_dict)
     _check_dict(MyDb.table1)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import narwhals as nw
+import polars as pl
 import pytest
 
 import framelib as fl
@@ -42,7 +44,7 @@ def test_schema_composite_pk_sql_generation() -> None:
     # Columns should NOT have PRIMARY KEY individually
     assert sql.count("PRIMARY KEY") == 1
     # Should have table-level constraint
-    assert 'PRIMARY KEY ("a", "b")' in sql or 'PRIMARY KEY ("b", "a")' in sql
+    assert 'PRIMARY KEY ("a", "b")' in sql
 
 
 def test_schema_single_pk_sql_generation() -> None:
@@ -68,6 +70,18 @@ def test_schema_empty_allowed() -> None:
     assert EmptyS.entries().len() == 0
 
 
+def test_base_schema_is_empty() -> None:
+    """The base Schema behaves as a schema without columns."""
+    df = pl.DataFrame({"a": [1]})
+
+    assert fl.Schema.entries().len() == 0
+    assert fl.Schema.to_pl() == pl.Schema()
+    assert not fl.Schema.to_sql()
+    assert fl.Schema.cast(df).collect().to_native().width == 0
+    assert fl.Schema.cast_strict_false(df).collect().width == 0
+    assert fl.Parquet(fl.Schema).schema is fl.Schema
+
+
 def test_schema_inheritance_column_order_preservation() -> None:
     """Inherited schema preserves parent columns before child columns."""
 
@@ -84,6 +98,98 @@ def test_schema_inheritance_column_order_preservation() -> None:
     assert col_names.index("parent_col2") < col_names.index("child_col")
 
 
+def test_schema_to_pl_includes_inherited_columns() -> None:
+    """to_pl returns the polars schema of the inherited and own columns, in order."""
+
+    class ParentS(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+
+    class ChildS(ParentS):
+        name: fl.String = fl.String()
+
+    assert ChildS.to_pl() == pl.Schema({"id": pl.Int64(), "name": pl.String()})
+    assert ParentS.to_pl() == pl.Schema({"id": pl.Int64()})
+
+
+def test_scalar_column_types_can_be_subclassed() -> None:
+    """User subclasses of the scalar column types keep their dtypes."""
+
+    class UserId(fl.Int64):
+        pass
+
+    class S(fl.Schema):
+        id: UserId = UserId(primary_key=True)
+
+    assert S.to_pl() == pl.Schema({"id": pl.Int64()})
+    assert S.id.nw_dtype == nw.Int64()
+    assert S.id.sql_type == "BIGINT"
+
+
+def test_column_exprs_select_the_column() -> None:
+    """nw_col and pl_col select the column by the name it is bound to in its schema."""
+
+    class S(fl.Schema):
+        price: fl.Float64 = fl.Float64()
+
+    df = pl.DataFrame({"price": [1.5], "other": [0]})
+    expected = df.select("price")
+    assert S.price.pl_col.meta.output_name() == "price"
+    assert df.select(S.price.pl_col).equals(expected)
+    assert nw.from_native(df).select(S.price.nw_col).to_native().equals(expected)
+
+
+def test_schema_cast_input_types() -> None:
+    """Cast selects and casts the schema columns from narwhals, polars lazy and eager frames."""
+
+    class S(fl.Schema):
+        id: fl.Int32 = fl.Int32()
+        age: fl.Int8 = fl.Int8()
+
+    df = pl.DataFrame({"id": [1, 2], "age": [30, 25], "extra": ["a", "b"]})
+    expected = pl.DataFrame(
+        {"id": [1, 2], "age": [30, 25]}, schema={"id": pl.Int32, "age": pl.Int8}
+    )
+    for frame in (df, df.lazy(), nw.from_native(df.lazy())):
+        result = S.cast(frame)
+        assert isinstance(result, nw.LazyFrame)
+        assert result.collect().to_native().equals(expected)
+
+
+def test_schema_cast_dtypes_match_across_paths() -> None:
+    """The polars and narwhals cast paths produce the same dtypes, including parametrized ones."""
+
+    class S(fl.Schema):
+        price: fl.Decimal = fl.Decimal(10, 2)
+        ts: fl.Datetime = fl.Datetime("ms")
+        tags: fl.List = fl.List(fl.Int16())
+
+    df = pl.DataFrame({"price": [1.5], "ts": [0], "tags": [[1, 2]]})
+    native = S.cast(df).collect().to_native().schema
+    narwhals = S.cast(nw.from_native(df.lazy())).collect().to_native().schema
+
+    assert native == narwhals == S.to_pl()
+    assert native["price"] == pl.Decimal(10, 2)
+
+
+def test_schema_without_own_columns_reuses_parent_caches() -> None:
+    """A subclass declaring no columns matches its parent, an overriding one gets its own definitions."""
+
+    class ParentS(fl.Schema):
+        id: fl.Int64 = fl.Int64(primary_key=True)
+
+    class AliasS(ParentS):
+        pass
+
+    class OverrideS(ParentS):
+        id: fl.Int32 = fl.Int32(primary_key=True)
+
+    assert AliasS.to_pl() == ParentS.to_pl()
+    assert AliasS.to_sql() == ParentS.to_sql()
+    assert AliasS.entries().keys() == ParentS.entries().keys()
+    assert OverrideS.to_pl() == pl.Schema({"id": pl.Int32()})
+    assert ParentS.to_pl() == pl.Schema({"id": pl.Int64()})
+
+
 def test_schema_to_sql_simple() -> None:
     """Schema generates valid SQL for simple structure."""
 
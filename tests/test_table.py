@@ -81,6 +81,11 @@ def test_table_access_outside_connection_raises(tmp_path: Path) -> None:
     with pytest.raises(ResultUnwrapError):
         _ = Project.db.t.relation.unwrap()
 
+    with Project.db:
+        assert Project.db.t.create_or_replace().relation.is_ok()
+    with pytest.raises(ResultUnwrapError):
+        _ = Project.db.t.relation.unwrap()
+
 
 # ============================================================================
 # Complex CRUD Operations Tests
@@ -114,6 +119,57 @@ def test_table_insert_into_append_behavior(tmp_path: Path) -> None:
         assert result.get_column("value").to_list() == ["a", "b", "c"]
 
 
+def test_table_insert_into_from_lazyframe(tmp_path: Path) -> None:
+    """insert_into accepts a LazyFrame, dropping extra columns and casting to the schema."""
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+        value: fl.String = fl.String()
+
+    class DB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: DB = DB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    lf = pl.LazyFrame(
+        {"extra": [0.5, 1.5], "value": ["a", "b"], "id": [1, 2]},
+        schema_overrides={"id": pl.Int8},
+    )
+    with Project.db:
+        result = Project.db.t.create_or_replace().insert_into(lf).read().sort("id")  # pyright: ignore[reportUnknownMemberType]
+    assert result.columns == ["id", "value"]
+    assert result.get_column("id").dtype == pl.Int64
+    assert result.get_column("value").to_list() == ["a", "b"]
+
+
+def test_table_insert_into_from_non_polars_frame(tmp_path: Path) -> None:
+    """insert_into casts frames from other backends through narwhals."""
+    import pyarrow as pa
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+        value: fl.String = fl.String()
+
+    class DB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: DB = DB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    tbl = pa.table({"value": ["a", "b"], "id": pa.array([1, 2], pa.int8())})
+    with Project.db:
+        result = Project.db.t.create_or_replace().insert_into(tbl).read().sort("id")  # pyright: ignore[reportUnknownMemberType]
+    assert result.columns == ["id", "value"]
+    assert result.get_column("id").dtype == pl.Int64
+
+
 def test_table_bulk_insert_or_replace(tmp_path: Path) -> None:
     """insert_or_replace handles bulk updates efficiently."""
 
@@ -363,6 +419,38 @@ def test_table_truncate_preserves_schema(tmp_path: Path) -> None:
         )
 
 
+def test_table_executes_every_statement_of_a_query(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A query containing several statements runs all of them, not only the first."""
+
+    class S(fl.Schema):
+        id: fl.Int64 = fl.Int64()
+
+    class DB(fl.DataBase):
+        t: fl.Table = fl.Table(schema=S)
+
+    class Project(fl.Folder):
+        __source__: Path = Path(tmp_path)
+        db: DB = DB()
+
+    Project.source().mkdir(parents=True, exist_ok=True)
+
+    def _truncate_and_refill(name: str) -> str:
+        return f"TRUNCATE TABLE {name}; INSERT INTO {name} VALUES (42);"
+
+    monkeypatch.setattr("framelib._database.qry.truncate", _truncate_and_refill)
+    with Project.db:
+        res = (
+            Project.db.t
+            .create_or_replace()
+            .insert_into(pl.DataFrame({"id": [1, 2]}))
+            .truncate()
+            .read()
+        )
+        assert res.get_column("id").to_list() == [42]
+
+
 def test_table_create_from_fails_if_exists(tmp_path: Path) -> None:
     """create_from raises error if table already exists."""
 